@@ -20,6 +20,12 @@ from keras_cv.layers.preprocessing.base_image_augmentation_layer import (
 )
 from keras_cv.utils import preprocessing
 
+# Panel blocking is only worthwhile when the interpolation working set of a
+# source image overflows the CPU cache; one megapixel is used as a fixed
+# threshold since cache sizes cannot be probed portably.
+_CACHE_BLOCK_MIN_PIXELS = 1024 * 1024
+_CACHE_BLOCK_PANEL_ROWS = 64
+
 
 @tf.keras.utils.register_keras_serializable(package="keras_cv")
 class RandomResizedCrop(BaseImageAugmentationLayer):
@@ -53,8 +59,17 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
             cropped image before resizing it to `target_size`.  For most tasks, this
             should be `(3/4, 4/3)`.  To perform a no-op provide the value `(1.0, 1.0)`.
         interpolation: (Optional) A string specifying the sampling method for
-            resizing. Defaults to "bilinear".
+            resizing, one of "bilinear" or "nearest"; these are the methods
+            supported by `tf.image.crop_and_resize`, which performs the crop
+            on the training path. Defaults to "bilinear".
         seed: (Optional) Used to create a random seed. Defaults to None.
+        cache_block: (Optional) Bool. When True and the source images are
+            statically known to be large (over ~1 megapixel), the batched
+            crop is computed in horizontal output panels so that each
+            kernel invocation's interpolation working set stays resident in
+            the CPU cache. The panel boxes reproduce the sampling grid of
+            the single fused call up to float32 rounding of the box
+            coordinates. Defaults to `False`.
     """
 
     def __init__(
@@ -64,11 +79,14 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
         aspect_ratio_factor,
         interpolation="bilinear",
         seed=None,
+        cache_block=False,
         **kwargs,
     ):
         super().__init__(seed=seed, **kwargs)
 
-        self._check_class_arguments(target_size, crop_area_factor, aspect_ratio_factor)
+        self._check_class_arguments(
+            target_size, crop_area_factor, aspect_ratio_factor, interpolation
+        )
 
         self.target_size = target_size
         self.aspect_ratio_factor = preprocessing.parse_factor(
@@ -86,8 +104,19 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
         )
 
         self.interpolation = interpolation
+        self.cache_block = cache_block
         self.seed = seed
 
+        # The batched augmentation is traced once so repeated shapes reuse the
+        # graph instead of re-dispatching ops eagerly. The trace is not XLA
+        # compiled: the box sampling goes through the stateful legacy RNG,
+        # whose seeds XLA fixes at compile time, which would replay the same
+        # crop boxes on every step.
+        self._batch_augment_fn = tf.function(
+            self._batch_augment_impl, reduce_retracing=True
+        )
+
+    @tf.function(reduce_retracing=True)
     def get_random_transformation(
         self, image=None, label=None, bounding_box=None, **kwargs
     ):
@@ -99,19 +128,16 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
         )  # to avoid unwanted/unintuitive effects
         new_width = tf.clip_by_value(tf.sqrt(crop_area_factor * aspect_ratio), 0.0, 1.0)
 
+        # The new sizes are clipped to [0, 1], so the valid offset range
+        # [0, 1 - new_size] is always non-negative and a unit uniform draw can
+        # simply be scaled into it, as on the batched path.
         height_offset = self._random_generator.random_uniform(
-            (),
-            minval=tf.minimum(0.0, 1.0 - new_height),
-            maxval=tf.maximum(0.0, 1.0 - new_height),
-            dtype=tf.float32,
-        )
+            (), minval=0.0, maxval=1.0, dtype=tf.float32
+        ) * (1.0 - new_height)
 
         width_offset = self._random_generator.random_uniform(
-            (),
-            minval=tf.minimum(0.0, 1.0 - new_width),
-            maxval=tf.maximum(0.0, 1.0 - new_width),
-            dtype=tf.float32,
-        )
+            (), minval=0.0, maxval=1.0, dtype=tf.float32
+        ) * (1.0 - new_width)
 
         y1 = height_offset
         y2 = height_offset + new_height
@@ -133,9 +159,149 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
             output["images"] = self._resize(inputs["images"])
             return self._format_output(output, is_dict, use_targets)
 
+    def _batch_augment(self, inputs):
+        return self._batch_augment_fn(inputs)
+
+    def _batch_augment_impl(self, inputs):
+        # Only images (and pass-through labels) are supported; other inputs
+        # such as bounding boxes would silently go stale while the images are
+        # geometrically transformed, so reject them like the per-sample path
+        # does.
+        unsupported_keys = [key for key in inputs if key not in ("images", "labels")]
+        if unsupported_keys:
+            raise ValueError(
+                "RandomResizedCrop does not yet support augmenting inputs "
+                f"other than images and labels. Received: {unsupported_keys}"
+            )
+
+        images = inputs.get("images", None)
+        batch_size = tf.shape(images)[0]
+
+        # Sampling one transformation per image and cropping the whole batch
+        # with a single `crop_and_resize` amortizes kernel-launch and
+        # memory-allocation overhead across the batch, instead of running one
+        # `crop_and_resize` per sample.
+        boxes = self._random_transformations(batch_size)
+
+        augmented_images = self._batch_crop_and_resize(
+            images, boxes, tf.range(batch_size)
+        )
+
+        inputs["images"] = tf.cast(augmented_images, self.compute_dtype)
+        return inputs
+
+    def _batch_crop_and_resize(self, images, boxes, box_indices):
+        if self.cache_block and self._should_cache_block(images):
+            return self._cache_blocked_crop_and_resize(images, boxes, box_indices)
+
+        return tf.image.crop_and_resize(
+            images,  # image shape: [B, H, W, C]
+            boxes,  # boxes: (B, 4); represents the area to be cropped from
+            # each respective image
+            box_indices,  # box_indices: maps boxes to images along batch axis
+            self.target_size,  # output size
+            method=self.interpolation,
+        )
+
+    def _should_cache_block(self, images):
+        height, width = images.shape[-3], images.shape[-2]
+        return (
+            height is not None
+            and width is not None
+            and height * width > _CACHE_BLOCK_MIN_PIXELS
+            and self.target_size[0] > _CACHE_BLOCK_PANEL_ROWS
+        )
+
+    def _cache_blocked_crop_and_resize(self, images, boxes, box_indices):
+        """Crops and resizes in horizontal panels of output rows.
+
+        Each panel's interpolation reads only a horizontal stripe of the
+        source image, so for large sources the working set of one
+        `crop_and_resize` invocation stays cache-resident. The panel boxes
+        walk the same sampling grid as a single call over the full boxes,
+        up to float32 rounding of the box coordinates: each panel's rows
+        are computed from a rounded panel start rather than the exact grid
+        position, which can shift a sampled row by an ulp of the source
+        coordinate.
+        """
+        target_height, target_width = self.target_size
+        y1, x1, y2, x2 = tf.unstack(boxes, axis=1)
+        # Row step of the output sampling grid in normalized coordinates.
+        row_step = (y2 - y1) / float(target_height - 1)
+
+        row_starts = list(range(0, target_height, _CACHE_BLOCK_PANEL_ROWS))
+        # A single-row panel samples the center of its box rather than its
+        # edges and would break the grid, so fold it into its predecessor.
+        if len(row_starts) > 1 and target_height - row_starts[-1] < 2:
+            row_starts.pop()
+
+        panels = []
+        for i, row_start in enumerate(row_starts):
+            row_end = (
+                row_starts[i + 1] if i + 1 < len(row_starts) else target_height
+            )
+            panel_boxes = tf.stack(
+                [y1 + row_step * row_start, x1, y1 + row_step * (row_end - 1), x2],
+                axis=1,
+            )
+            panels.append(
+                tf.image.crop_and_resize(
+                    images,
+                    panel_boxes,
+                    box_indices,
+                    (row_end - row_start, target_width),
+                    method=self.interpolation,
+                )
+            )
+        return tf.concat(panels, axis=1)
+
+    def _random_transformations(self, batch_size):
+        """Samples `batch_size` crop boxes in one vectorized draw.
+
+        Returns a `[batch_size, 4]` tensor of `[y1, x1, y2, x2]` boxes in
+        normalized coordinates.  Sampling all boxes at once replaces
+        `batch_size` scalar random draws (and the scalar arithmetic on each)
+        with a handful of vector ops of length `batch_size`.
+        """
+        crop_area_factor = self.crop_area_factor(shape=(batch_size,))
+        aspect_ratio = self.aspect_ratio_factor(shape=(batch_size,))
+
+        new_heights = tf.clip_by_value(
+            tf.sqrt(crop_area_factor / aspect_ratio), 0.0, 1.0
+        )  # to avoid unwanted/unintuitive effects
+        new_widths = tf.clip_by_value(
+            tf.sqrt(crop_area_factor * aspect_ratio), 0.0, 1.0
+        )
+
+        # The new sizes are clipped to [0, 1], so the valid offset range
+        # [0, 1 - new_size] is always non-negative and can be sampled by
+        # scaling a unit uniform draw.
+        height_offsets = self._random_generator.random_uniform(
+            (batch_size,), minval=0.0, maxval=1.0, dtype=tf.float32
+        ) * (1.0 - new_heights)
+        width_offsets = self._random_generator.random_uniform(
+            (batch_size,), minval=0.0, maxval=1.0, dtype=tf.float32
+        ) * (1.0 - new_widths)
+
+        return tf.stack(
+            [
+                height_offsets,
+                width_offsets,
+                height_offsets + new_heights,
+                width_offsets + new_widths,
+            ],
+            axis=1,
+        )
+
     def augment_image(self, image, transformation, **kwargs):
+        return self._crop_and_resize(image, transformation)
+
+    # `augment_image()` is invoked once per image, so the crop is traced with
+    # `tf.function` to avoid paying per-op eager dispatch overhead on every
+    # sample.  `reduce_retracing` keeps variable-size inputs from retracing.
+    @tf.function(reduce_retracing=True)
+    def _crop_and_resize(self, image, boxes):
         image = tf.expand_dims(image, axis=0)
-        boxes = transformation
 
         # See bit.ly/tf_crop_resize for more details
         augmented_image = tf.image.crop_and_resize(
@@ -145,17 +311,55 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
             [0],  # box_indices: maps boxes to images along batch axis
             # [0] since there is only one image
             self.target_size,  # output size
+            method=self.interpolation,
         )
 
         return tf.squeeze(augmented_image, axis=0)
 
+    @tf.function(reduce_retracing=True)
     def _resize(self, image):
-        outputs = tf.keras.preprocessing.image.smart_resize(image, self.target_size)
-        # smart_resize will always output float32, so we need to re-cast.
+        # Cropping first and resizing the crop performs the equivalent of
+        # smart_resize (aspect-ratio preserving center crop, then resize) in
+        # one traced graph: the crop is a slice, so the pixels are only
+        # interpolated once, by the resize.
+        image = self._center_crop_to_target_aspect_ratio(image)
+        outputs = tf.image.resize(
+            image, self.target_size, method=self.interpolation
+        )
+        # tf.image.resize will always output float32, so we need to re-cast.
         return tf.cast(outputs, self.compute_dtype)
 
+    def _center_crop_to_target_aspect_ratio(self, image):
+        """Center-crops `image` to the aspect ratio of `target_size`.
+
+        When the image already has the target aspect ratio the crop resolves
+        to an identity slice.
+        """
+        shape = tf.shape(image)
+        height, width = shape[-3], shape[-2]
+        target_height, target_width = self.target_size
+
+        crop_height = tf.cast(
+            tf.cast(width * target_height, tf.float32) / target_width, tf.int32
+        )
+        crop_width = tf.cast(
+            tf.cast(height * target_width, tf.float32) / target_height, tf.int32
+        )
+        crop_height = tf.minimum(height, crop_height)
+        crop_width = tf.minimum(width, crop_width)
+
+        crop_height_start = tf.cast(
+            tf.cast(height - crop_height, tf.float32) / 2, tf.int32
+        )
+        crop_width_start = tf.cast(
+            tf.cast(width - crop_width, tf.float32) / 2, tf.int32
+        )
+        return tf.image.crop_to_bounding_box(
+            image, crop_height_start, crop_width_start, crop_height, crop_width
+        )
+
     def _check_class_arguments(
-        self, target_size, crop_area_factor, aspect_ratio_factor
+        self, target_size, crop_area_factor, aspect_ratio_factor, interpolation
     ):
         if (
             not isinstance(target_size, (tuple, list))
@@ -191,6 +395,104 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
                 f"aspect_ratio_factor={aspect_ratio_factor}"
             )
 
+        if interpolation not in ("nearest", "bilinear"):
+            raise NotImplementedError(
+                f"Unknown `interpolation` {interpolation}. Only `nearest` and "
+                "`bilinear` are supported, as the crop is performed with "
+                "`tf.image.crop_and_resize`."
+            )
+
+    def augment_encoded_image(self, encoded_image):
+        """Augments a JPEG-encoded image without fully decoding it.
+
+        The crop box is sampled first and only that region is decoded via
+        `tf.io.decode_and_crop_jpeg`, so for pipelines that crop away most of
+        a large JPEG the decode cost drops proportionally to the crop area.
+        The decoded crop is then resized to `target_size`.
+
+        Args:
+            encoded_image: a scalar string tensor containing the bytes of a
+                JPEG-encoded image.
+
+        Returns:
+            A 3D image tensor of shape `target_size + (3,)` in the layer's
+            compute dtype.
+        """
+        image_shape = tf.image.extract_jpeg_shape(encoded_image)
+        height = tf.cast(image_shape[0], tf.float32)
+        width = tf.cast(image_shape[1], tf.float32)
+
+        y1, x1, y2, x2 = self.get_random_transformation()[0]
+
+        # Convert the normalized [y1, x1, y2, x2] box to a pixel
+        # [y, x, height, width] crop window, clamped to the image bounds.
+        crop_y = tf.cast(y1 * height, tf.int32)
+        crop_x = tf.cast(x1 * width, tf.int32)
+        crop_height = tf.maximum(tf.cast((y2 - y1) * height, tf.int32), 1)
+        crop_width = tf.maximum(tf.cast((x2 - x1) * width, tf.int32), 1)
+        crop_height = tf.minimum(crop_height, image_shape[0] - crop_y)
+        crop_width = tf.minimum(crop_width, image_shape[1] - crop_x)
+        crop_window = tf.stack([crop_y, crop_x, crop_height, crop_width])
+
+        image = tf.io.decode_and_crop_jpeg(encoded_image, crop_window, channels=3)
+        image = tf.image.resize(
+            image, self.target_size, method=self.interpolation
+        )
+        return tf.cast(image, self.compute_dtype)
+
+    def as_map_fn(self, encoded=False):
+        """Returns a traced callable for use with `tf.data.Dataset.map`.
+
+        By default the returned function applies the layer's training-time
+        augmentation to a batch of images, passing labels through unchanged
+        when present. Recommended usage:
+
+        ```python
+        layer = keras_cv.layers.RandomResizedCrop(
+            target_size=(224, 224),
+            crop_area_factor=(0.08, 1.0),
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+        )
+        dataset = (
+            dataset.batch(batch_size)
+            .map(layer.as_map_fn(), num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        ```
+
+        Mapping with `num_parallel_calls=tf.data.AUTOTUNE` overlaps the CPU
+        side augmentation with accelerator compute.
+
+        Args:
+            encoded: (Optional) Bool. When True, the returned function expects
+                a scalar string of JPEG bytes per example instead of a decoded
+                image batch, and uses `augment_encoded_image` to decode only
+                the cropped region. Map it over the unbatched dataset before
+                batching:
+
+                ```python
+                dataset = (
+                    dataset.map(
+                        layer.as_map_fn(encoded=True),
+                        num_parallel_calls=tf.data.AUTOTUNE,
+                    )
+                    .batch(batch_size)
+                    .prefetch(tf.data.AUTOTUNE)
+                )
+                ```
+        """
+        if encoded:
+            augment = tf.function(self.augment_encoded_image)
+        else:
+            augment = tf.function(lambda images: self(images, training=True))
+
+        def map_fn(images, labels=None):
+            if labels is None:
+                return augment(images)
+            return augment(images), labels
+
+        return map_fn
+
     def augment_target(self, augment_target, **kwargs):
         return augment_target
 
@@ -203,6 +505,7 @@ class RandomResizedCrop(BaseImageAugmentationLayer):
                 "aspect_ratio_factor": self.aspect_ratio_factor,
                 "interpolation": self.interpolation,
                 "seed": self.seed,
+                "cache_block": self.cache_block,
             }
         )
         return config
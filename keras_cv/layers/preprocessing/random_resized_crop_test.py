@@ -72,6 +72,30 @@ class RandomResizedCropTest(tf.test.TestCase, parameterized.TestCase):
 
         self.assertAllClose(output, input_resized)
 
+    @parameterized.named_parameters(
+        ("Wide", (300, 400)),
+        ("Tall", (400, 300)),
+    )
+    def test_inference_matches_smart_resize(self, image_size):
+        # The inference path reproduces smart_resize (aspect-ratio preserving
+        # center crop, then resize), which only differs from a plain resize on
+        # non-square inputs.
+        image_shape = (self.batch_size,) + image_size + (3,)
+        image = tf.random.uniform(shape=image_shape)
+
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+            crop_area_factor=(0.8, 1.0),
+        )
+
+        expected = tf.keras.preprocessing.image.smart_resize(
+            image, self.target_size
+        )
+        output = layer(image, training=False)
+
+        self.assertAllClose(output, expected)
+
     @parameterized.named_parameters(
         ("Not tuple or list", dict()),
         ("Length not equal to 2", [1, 2, 3]),
@@ -106,6 +130,174 @@ class RandomResizedCropTest(tf.test.TestCase, parameterized.TestCase):
                 crop_area_factor=(0.8, 1.0),
             )
 
+    def test_batched_path_matches_per_sample_crop(self):
+        input_image_shape = (self.batch_size, self.height, self.width, 3)
+        image = tf.random.uniform(shape=input_image_shape, seed=self.seed)
+
+        # Constant factors make the sampled boxes deterministic (the whole
+        # image), so the fused batched crop can be compared against cropping
+        # each sample individually.
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(1.0, 1.0),
+            crop_area_factor=(1.0, 1.0),
+        )
+        output = layer(image, training=True)
+
+        whole_image_box = tf.constant([[0.0, 0.0, 1.0, 1.0]])
+        expected = tf.stack(
+            [
+                layer.augment_image(image[i], whole_image_box)
+                for i in range(self.batch_size)
+            ]
+        )
+
+        self.assertAllClose(output, expected)
+
+    def test_augmentations_differ_across_calls(self):
+        input_image_shape = (self.batch_size, self.height, self.width, 3)
+        image = tf.random.uniform(shape=input_image_shape, seed=self.seed)
+
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+            crop_area_factor=(0.08, 1.0),
+            seed=self.seed,
+        )
+
+        self.assertNotAllClose(
+            layer(image, training=True), layer(image, training=True)
+        )
+
+    def test_as_map_fn_with_labels(self):
+        images = tf.random.uniform((8, self.height, self.width, 3))
+        labels = tf.range(8)
+
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+            crop_area_factor=(0.8, 1.0),
+        )
+        dataset = (
+            tf.data.Dataset.from_tensor_slices((images, labels))
+            .batch(self.batch_size)
+            .map(layer.as_map_fn())
+        )
+
+        augmented_images, batch_labels = next(iter(dataset))
+        self.assertAllEqual(
+            augmented_images.shape, (self.batch_size,) + self.target_size + (3,)
+        )
+        self.assertAllEqual(batch_labels, tf.range(self.batch_size))
+
+    def test_as_map_fn_without_labels(self):
+        images = tf.random.uniform((8, self.height, self.width, 3))
+
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+            crop_area_factor=(0.8, 1.0),
+        )
+        dataset = (
+            tf.data.Dataset.from_tensor_slices(images)
+            .batch(self.batch_size)
+            .map(layer.as_map_fn())
+        )
+
+        augmented_images = next(iter(dataset))
+        self.assertAllEqual(
+            augmented_images.shape, (self.batch_size,) + self.target_size + (3,)
+        )
+
+    def test_augment_encoded_image(self):
+        image = tf.cast(
+            tf.random.uniform(
+                (self.height, self.width, 3), maxval=256, seed=self.seed
+            ),
+            tf.uint8,
+        )
+        encoded_image = tf.io.encode_jpeg(image)
+
+        # Constant factors sample the whole image as the crop box, so the
+        # pixel crop window must clamp exactly to the image bounds and the
+        # output reduces to a resize of the fully decoded JPEG.
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(1.0, 1.0),
+            crop_area_factor=(1.0, 1.0),
+        )
+        output = layer.augment_encoded_image(encoded_image)
+
+        decoded_image = tf.io.decode_jpeg(encoded_image, channels=3)
+        expected = tf.image.resize(decoded_image, self.target_size)
+
+        self.assertAllEqual(output.shape, self.target_size + (3,))
+        self.assertAllClose(output, expected)
+
+    def test_cache_blocked_crop_matches_single_crop(self):
+        # (1200, 1024) puts the static image size over the one-megapixel
+        # threshold, so the cache-blocked layer takes the panel path.
+        image = tf.random.uniform(shape=(2, 1200, 1024, 3), seed=self.seed)
+
+        # Constant factors make the sampled boxes deterministic (the whole
+        # image), so the panel output can be compared against the single
+        # fused crop_and_resize call. The panel boxes only reproduce the
+        # fused sampling grid up to float32 rounding of the box
+        # coordinates, which at source coordinates ~1000 perturbs the
+        # sampled rows by ~1e-4 pixels, so the tolerance is loose.
+        blocked_layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(1.0, 1.0),
+            crop_area_factor=(1.0, 1.0),
+            cache_block=True,
+        )
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(1.0, 1.0),
+            crop_area_factor=(1.0, 1.0),
+        )
+
+        self.assertAllClose(
+            blocked_layer(image, training=True),
+            layer(image, training=True),
+            atol=1e-3,
+        )
+
+    def test_unsupported_input_keys_error(self):
+        layer = preprocessing.RandomResizedCrop(
+            target_size=self.target_size,
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+            crop_area_factor=(0.8, 1.0),
+        )
+        inputs = {
+            "images": tf.random.uniform((self.batch_size, 64, 64, 3)),
+            "bounding_boxes": tf.zeros((self.batch_size, 3, 4)),
+        }
+        with self.assertRaisesRegex(
+            ValueError,
+            "does not yet support augmenting inputs other than images and "
+            "labels",
+        ):
+            layer(inputs, training=True)
+
+    @parameterized.named_parameters(
+        ("Bicubic", "bicubic"),
+        ("Lanczos", "lanczos3"),
+        ("Area", "area"),
+    )
+    def test_interpolation_errors(self, interpolation):
+        with self.assertRaisesRegex(
+            NotImplementedError,
+            "Unknown `interpolation` (.*). Only `nearest` and `bilinear` are "
+            "supported",
+        ):
+            _ = preprocessing.RandomResizedCrop(
+                target_size=(224, 224),
+                aspect_ratio_factor=(3 / 4, 4 / 3),
+                crop_area_factor=(0.8, 1.0),
+                interpolation=interpolation,
+            )
+
     @parameterized.named_parameters(
         ("Not tuple or list", dict()),
         ("Single integer", 5),
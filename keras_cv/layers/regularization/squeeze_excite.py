@@ -16,6 +16,11 @@ import tensorflow as tf
 from tensorflow.keras import layers
 
 
+def _hard_sigmoid(x):
+    """MobileNetV3's hard sigmoid, `relu6(x + 3) / 6`."""
+    return tf.nn.relu6(x + 3.0) * (1.0 / 6.0)
+
+
 @tf.keras.utils.register_keras_serializable(package="keras_cv")
 class SqueezeAndExcite2D(layers.Layer):
     """
@@ -23,10 +28,9 @@ class SqueezeAndExcite2D(layers.Layer):
     [Squeeze-and-Excitation Networks](https://arxiv.org/pdf/1709.01507.pdf).
     This layer tries to use a content aware mechanism to assign channel-wise
     weights adaptively. It first squeezes the feature maps into a single value
-    using global average pooling, which are then fed into two Conv1D layers,
-    which act like fully-connected layers. The first layer reduces the
-    dimensionality of the feature maps by a factor of `ratio`, whereas the second
-    layer restores it to its original value.
+    using global average pooling, which is then fed into two Dense layers. The
+    first layer reduces the dimensionality of the feature maps by a factor of
+    `ratio`, whereas the second layer restores it to its original value.
 
     The resultant values are the adaptive weights for each channel. These
     weights are then multiplied with the original inputs to scale the outputs
@@ -43,7 +47,15 @@ class SqueezeAndExcite2D(layers.Layer):
             be applied after squeeze convolution. Defaults to `relu`.
         excite_activation: (Optional) String, callable (or tf.keras.layers.Layer) or
             tf.keras.activations.Activation instance denoting activation to
-            be applied after excite convolution. Defaults to `sigmoid`.
+            be applied after excite convolution. Defaults to `sigmoid`. The
+            string `"hard_sigmoid"` selects the MobileNetV3 formulation,
+            `relu6(x + 3) / 6`, which avoids the transcendental sigmoid and is
+            substantially cheaper on CPU.
+        data_format: (Optional) String, either `"channels_last"` (NHWC) or
+            `"channels_first"` (NCHW). Running the block in the layout of the
+            surrounding network avoids layout-transpose ops around it; NCHW is
+            the layout preferred by cuDNN. Defaults to the value of
+            `tf.keras.backend.image_data_format()`.
     Usage:
 
     ```python
@@ -53,6 +65,26 @@ class SqueezeAndExcite2D(layers.Layer):
     output = keras_cv.layers.SqueezeAndExciteBlock(16)(x)
     # (...)
     ```
+
+    XLA fusion:
+
+    The block is built from fusible ops (mean, matmul, activation, multiply),
+    so compiling the enclosing model with XLA — e.g.
+    `model.compile(jit_compile=True)` or wrapping the train step in
+    `tf.function(jit_compile=True)` — fuses the whole
+    pool -> GEMM -> activation -> GEMM -> activation -> multiply chain into
+    one or two kernels: the feature map is read from memory once and only the
+    scaled output is written back, instead of one round trip per op.
+
+    Reduced precision:
+
+    The block is tolerant to low precision, so for inference on bf16/fp16
+    capable hardware the standard Keras dtype policies apply, e.g.
+    `SqueezeAndExcite2D(16, dtype="mixed_bfloat16")` runs the pooling, GEMMs
+    and scale multiply in bfloat16 while keeping float32 variables, halving
+    the memory traffic of this bandwidth-bound block. For int8 deployment the
+    block is built from ops (mean, matmul, sigmoid, multiply) that TFLite's
+    post-training quantization absorbs unchanged.
     """
 
     def __init__(
@@ -61,39 +93,76 @@ class SqueezeAndExcite2D(layers.Layer):
         ratio=0.25,
         squeeze_activation="relu",
         excite_activation="sigmoid",
+        data_format=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
 
-        self.filters = filters
-
-        if ratio <= 0.0 or ratio >= 1.0:
-            raise ValueError(f"`ratio` should be a float between 0 and 1. Got {ratio}")
-
-        if filters <= 0 or not isinstance(filters, int):
-            raise ValueError(f"`filters` should be a positive integer. Got {filters}")
+        if data_format is None:
+            data_format = tf.keras.backend.image_data_format()
+        if data_format not in ("channels_last", "channels_first"):
+            raise ValueError(
+                '`data_format` should be either "channels_last" or '
+                f'"channels_first". Got {data_format}'
+            )
+        self.data_format = data_format
 
+        self.filters = filters
         self.ratio = ratio
-        self.bottleneck_filters = int(self.filters * self.ratio)
-
         self.squeeze_activation = squeeze_activation
         self.excite_activation = excite_activation
 
-        self.global_average_pool = layers.GlobalAveragePooling2D(keepdims=True)
-        self.squeeze_conv = layers.Conv2D(
+        if ratio <= 0.0 or ratio >= 1.0:
+            raise ValueError(
+                f"`ratio` should be a float between 0 and 1. Got {ratio}"
+            )
+
+        if filters <= 0 or not isinstance(filters, int):
+            raise ValueError(
+                f"`filters` should be a positive integer. Got {filters}"
+            )
+
+        self.bottleneck_filters = int(filters * ratio)
+
+        squeeze_activation_fn = tf.keras.activations.get(squeeze_activation)
+        if excite_activation == "hard_sigmoid":
+            excite_activation_fn = _hard_sigmoid
+        else:
+            excite_activation_fn = tf.keras.activations.get(excite_activation)
+
+        # After global average pooling the spatial dims are 1x1, so 1x1
+        # convolutions here are mathematically plain matmuls.  Dense layers on
+        # the squeezed (batch_size, filters) tensor dispatch straight GEMMs
+        # without the convolution kernel's layout bookkeeping.
+        self.squeeze_dense = layers.Dense(
             self.bottleneck_filters,
-            (1, 1),
-            activation=self.squeeze_activation,
-        )
-        self.excite_conv = layers.Conv2D(
-            self.filters, (1, 1), activation=self.excite_activation
+            activation=squeeze_activation_fn,
         )
+        self.excite_dense = layers.Dense(self.filters)
+
+        # The excite activation is applied outside the Dense layer so that it
+        # can fuse with the broadcasting multiply that follows it.
+        self._excite_activation_fn = excite_activation_fn
 
     def call(self, inputs, training=True):
-        x = self.global_average_pool(inputs)  # x: (batch_size, 1, 1, filters)
-        x = self.squeeze_conv(x)  # x: (batch_size, 1, 1, bottleneck_filters)
-        x = self.excite_conv(x)  # x: (batch_size, 1, 1, filters)
-        x = tf.math.multiply(x, inputs)  # x: (batch_size, h, w, filters)
+        # Cast explicitly so direct `call` invocations honor reduced-precision
+        # dtype policies; under the default float32 policy this is a no-op.
+        inputs = tf.cast(inputs, self.compute_dtype)
+        # A raw reduce_mean emits a smaller graph than GlobalAveragePooling2D
+        # and lets XLA fuse the pool with the following matmul.
+        spatial_axes = [2, 3] if self.data_format == "channels_first" else [1, 2]
+        x = tf.reduce_mean(inputs, axis=spatial_axes)  # x: (batch_size, filters)
+        x = self.squeeze_dense(x)  # x: (batch_size, bottleneck_filters)
+        x = self._excite_activation_fn(
+            self.excite_dense(x)
+        )  # x: (batch_size, filters)
+        if self.data_format == "channels_first":
+            x = x[:, :, None, None]  # x: (batch_size, filters, 1, 1)
+        else:
+            x = x[:, None, None, :]  # x: (batch_size, 1, 1, filters)
+        # The scale is already rank 4, so the operator broadcast needs no
+        # extra reshape and skips the tf.math.multiply op-factory overhead.
+        x = x * inputs  # x: (batch_size, h, w, filters)
         return x
 
     def get_config(self):
@@ -102,6 +171,7 @@ class SqueezeAndExcite2D(layers.Layer):
             "ratio": self.ratio,
             "squeeze_activation": self.squeeze_activation,
             "excite_activation": self.excite_activation,
+            "data_format": self.data_format,
         }
         base_config = super().get_config()
         return dict(list(base_config.items()) + list(config.items()))
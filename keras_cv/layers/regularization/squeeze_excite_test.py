@@ -15,6 +15,7 @@
 import tensorflow as tf
 
 from keras_cv.layers import SqueezeAndExcite2D
+from keras_cv.layers.regularization import squeeze_excite
 
 
 class SqueezeAndExcite2DTest(tf.test.TestCase):
@@ -42,6 +43,42 @@ class SqueezeAndExcite2DTest(tf.test.TestCase):
         outputs = layer(inputs)
         self.assertEquals(inputs.shape, outputs.shape)
 
+    def test_channels_first_matches_channels_last(self):
+        inputs = tf.random.uniform((1, 4, 4, 8))
+        inputs_first = tf.transpose(inputs, [0, 3, 1, 2])
+
+        layer_last = SqueezeAndExcite2D(8, ratio=0.25)
+        layer_first = SqueezeAndExcite2D(8, ratio=0.25, data_format="channels_first")
+
+        # Build both layers, then copy the weights so the comparison only
+        # exercises the layout handling.
+        layer_last(inputs)
+        layer_first(inputs_first)
+        layer_first.set_weights(layer_last.get_weights())
+
+        outputs_last = layer_last(inputs)
+        outputs_first = layer_first(inputs_first)
+
+        self.assertAllClose(
+            tf.transpose(outputs_first, [0, 2, 3, 1]), outputs_last
+        )
+
+    def test_hard_sigmoid_values(self):
+        x = tf.constant([-4.0, -3.0, 0.0, 3.0, 4.0])
+        self.assertAllClose(
+            squeeze_excite._hard_sigmoid(x), [0.0, 0.0, 0.5, 1.0, 1.0]
+        )
+
+    def test_hard_sigmoid_config_round_trip(self):
+        layer = SqueezeAndExcite2D(8, ratio=0.25, excite_activation="hard_sigmoid")
+        config = layer.get_config()
+        self.assertEqual(config["excite_activation"], "hard_sigmoid")
+
+        restored = SqueezeAndExcite2D.from_config(config)
+        inputs = tf.random.uniform((1, 4, 4, 8))
+        outputs = restored(inputs)
+        self.assertEquals(inputs.shape, outputs.shape)
+
     def test_raises_invalid_ratio_error(self):
         with self.assertRaisesRegex(
             ValueError, "`ratio` should be a float" " between 0 and 1. Got (.*?)"